@@ -0,0 +1 @@
+# Placing conftest.py at the project root puts backend_fastapi on sys.path, so tests can import `src.api`.
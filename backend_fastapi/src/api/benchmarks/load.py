@@ -0,0 +1,251 @@
+"""In-process load harness for event ingest and websocket broadcast throughput.
+
+Everything runs inside one event loop against the ASGI app: HTTP traffic goes through
+httpx's ASGI transport and websocket clients speak the ASGI websocket protocol directly,
+so no server process or network is involved. Run from ``backend_fastapi``::
+
+    python -m src.api.benchmarks.load --ingest-events 2000 --clients 200 --output load.json
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from src.api.benchmarks.results import build_result, emit, summarize_timings
+from src.api.benchmarks.synthetic import (
+    WorkloadConfig,
+    add_workload_arguments,
+    config_from_args,
+    iter_events,
+    synthetic_store,
+)
+from src.api.main import app
+from src.api.models import BehaviorEvent
+from src.api.sockets import broadcast_event
+
+
+# PUBLIC_INTERFACE
+class InProcessWebSocket:
+    """Minimal ASGI websocket client that connects to an app without a server.
+
+    Counts received messages and, for ``type=event`` messages registered in ``sent_at``, counts
+    them as tracked and records delivery latency relative to their publish time.
+    """
+
+    def __init__(self, asgi_app, path: str, sent_at: Dict[str, float]):
+        self._app = asgi_app
+        self._path = path
+        self._sent_at = sent_at
+        self._inbound: asyncio.Queue = asyncio.Queue()
+        self._accepted = asyncio.Event()
+        self._reached = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._target = 0
+        self.received = 0
+        self.tracked = 0
+        self.latencies_s: List[float] = []
+
+    async def connect(self, timeout: float = 5.0) -> None:
+        scope = {
+            "type": "websocket",
+            "asgi": {"version": "3.0"},
+            "scheme": "ws",
+            "path": self._path,
+            "raw_path": self._path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [],
+            "client": ("bench", 0),
+            "server": ("bench", 80),
+            "subprotocols": [],
+        }
+        self._task = asyncio.create_task(self._app(scope, self._inbound.get, self._send))
+        await self._inbound.put({"type": "websocket.connect"})
+        await asyncio.wait_for(self._accepted.wait(), timeout=timeout)
+
+    async def _send(self, message: Dict[str, Any]) -> None:
+        kind = message["type"]
+        if kind == "websocket.accept":
+            self._accepted.set()
+        elif kind == "websocket.send":
+            now = time.perf_counter()
+            self.received += 1
+            payload = json.loads(message.get("text") or "{}")
+            if payload.get("type") == "event":
+                sent = self._sent_at.get(payload["data"]["id"])
+                if sent is not None:
+                    self.tracked += 1
+                    self.latencies_s.append(now - sent)
+            if self._target and self.tracked >= self._target:
+                self._reached.set()
+
+    async def wait_for(self, count: int, timeout: float) -> bool:
+        """Wait until at least count tracked events have been received; return False on timeout."""
+        if self.tracked >= count:
+            return True
+        self._target = count
+        self._reached.clear()
+        try:
+            await asyncio.wait_for(self._reached.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def close(self, timeout: float = 5.0) -> None:
+        await self._inbound.put({"type": "websocket.disconnect", "code": 1000})
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(self._task, timeout=timeout)
+            except Exception:
+                self._task.cancel()
+
+
+def _ingest_payloads(config: WorkloadConfig, count: int) -> List[Dict[str, Any]]:
+    """Build ingest payloads for existing synthetic sessions with ids that do not collide with the store."""
+    source = config.model_copy(update={"seed": config.seed + 1})
+    payloads: List[Dict[str, Any]] = []
+    for i, event in enumerate(iter_events(source)):
+        if i >= count:
+            break
+        body = event.model_dump(mode="json")
+        body["id"] = f"load-e-{i}"
+        payloads.append(body)
+    return payloads
+
+
+# PUBLIC_INTERFACE
+async def run_ingest(config: WorkloadConfig, events: int, concurrency: int) -> Dict[str, Any]:
+    """POST events to /ingest/event through the ASGI transport and measure throughput and latency."""
+    payloads = _ingest_payloads(config, events)
+    queue: asyncio.Queue = asyncio.Queue()
+    for body in payloads:
+        queue.put_nowait(body)
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker():
+            while not queue.empty():
+                body = queue.get_nowait()
+                t0 = time.perf_counter()
+                resp = await client.post("/ingest/event", json=body)
+                latencies.append(time.perf_counter() - t0)
+                key = str(resp.status_code)
+                statuses[key] = statuses.get(key, 0) + 1
+
+        t_start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+        elapsed = time.perf_counter() - t_start
+
+    return {
+        "requests": len(payloads),
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 4),
+        "requests_per_s": round(len(payloads) / elapsed, 2) if elapsed > 0 else 0.0,
+        "status_codes": statuses,
+        "latency": summarize_timings(latencies),
+    }
+
+
+# PUBLIC_INTERFACE
+async def run_broadcast(
+    config: WorkloadConfig,
+    clients: int,
+    messages: int,
+    timeout: float = 60.0,
+) -> Dict[str, Any]:
+    """Connect websocket clients to /ws/events, broadcast events and measure fan-out throughput."""
+    sent_at: Dict[str, float] = {}
+    conns = [InProcessWebSocket(app, "/ws/events", sent_at) for _ in range(clients)]
+    for conn in conns:
+        await conn.connect()
+
+    events: List[BehaviorEvent] = []
+    for i, event in enumerate(iter_events(config.model_copy(update={"seed": config.seed + 2}))):
+        if i >= messages:
+            break
+        events.append(event.model_copy(update={"id": f"bcast-e-{i}"}))
+
+    t_start = time.perf_counter()
+    for event in events:
+        sent_at[event.id] = time.perf_counter()
+        broadcast_event(event)
+        await asyncio.sleep(0)
+    delivered_all = all(await asyncio.gather(*(c.wait_for(len(events), timeout) for c in conns)))
+    elapsed = time.perf_counter() - t_start
+
+    for conn in conns:
+        await conn.close()
+
+    delivered = sum(c.tracked for c in conns)
+    latencies = [lat for c in conns for lat in c.latencies_s]
+    return {
+        "clients": clients,
+        "messages": len(events),
+        "delivered": delivered,
+        "complete": delivered_all,
+        "elapsed_s": round(elapsed, 4),
+        "deliveries_per_s": round(delivered / elapsed, 2) if elapsed > 0 else 0.0,
+        "latency": summarize_timings(latencies),
+    }
+
+
+# PUBLIC_INTERFACE
+async def run_load(
+    config: WorkloadConfig,
+    ingest_events: int = 500,
+    concurrency: int = 8,
+    clients: int = 50,
+    messages: int = 200,
+) -> Dict[str, Any]:
+    """Run the ingest and broadcast phases against a synthetic store and return the result document.
+
+    Ingest is measured without websocket clients attached; broadcast fan-out is published to the
+    bus directly from the event loop so that the two costs are reported separately.
+    """
+    # The lifespan starts the broadcast bus; httpx's ASGI transport does not run it by itself.
+    async with app.router.lifespan_context(app):
+        with synthetic_store(config) as store:
+            results = {
+                "ingest": await run_ingest(config, ingest_events, concurrency),
+                "broadcast": await run_broadcast(config, clients, messages),
+            }
+    params = {
+        "ingest_events": ingest_events,
+        "concurrency": concurrency,
+        "clients": clients,
+        "messages": messages,
+        "store": store,
+    }
+    return build_result("load", {**config.model_dump(mode="json"), **params}, results)
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="In-process ingest and websocket broadcast load harness.")
+    add_workload_arguments(parser)
+    parser.add_argument("--ingest-events", type=int, default=500, help="Events to POST to /ingest/event.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent ingest clients.")
+    parser.add_argument("--clients", type=int, default=50, help="Websocket clients connected to /ws/events.")
+    parser.add_argument("--messages", type=int, default=200, help="Events broadcast to websocket clients.")
+    parser.add_argument("--output", default=None, help="Write JSON results to this path instead of stdout.")
+    args = parser.parse_args(argv)
+    result = asyncio.run(
+        run_load(
+            config_from_args(args),
+            ingest_events=args.ingest_events,
+            concurrency=args.concurrency,
+            clients=args.clients,
+            messages=args.messages,
+        )
+    )
+    emit(result, args.output)
+
+
+if __name__ == "__main__":
+    main()
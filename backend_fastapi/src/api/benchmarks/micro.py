@@ -0,0 +1,137 @@
+"""Micro-benchmarks for the analytics functions and report exporters.
+
+By default the whole workload is loaded into the in-memory store, which costs about
+``APPROX_BYTES_PER_EVENT`` (~1.25 KB) per event: a few million events is the practical ceiling.
+With ``--chunk-events`` the workload is streamed through the store a chunk of whole sessions at a
+time, so tens of millions of events can be benchmarked in bounded memory; timings are then
+per chunk and aggregated over all chunks.
+
+Run from ``backend_fastapi``::
+
+    python -m src.api.benchmarks.micro --sessions 50 --events-per-session 2000 --output micro.json
+    python -m src.api.benchmarks.micro --sessions 2000 --events-per-session 10000 --chunk-events 500000
+"""
+
+import argparse
+from typing import Any, Callable, Dict, List, Optional
+
+from src.api.benchmarks.results import build_result, emit, summarize_timings, time_call, time_samples
+from src.api.benchmarks.synthetic import (
+    BENCH_REPORT_ID,
+    WorkloadConfig,
+    add_workload_arguments,
+    config_from_args,
+    iter_session_chunks,
+    session_ids,
+    synthetic_store,
+)
+from src.api.models import (
+    EVENTS,
+    REPORTS,
+    Report,
+    compute_baseline_comparison,
+    compute_diversity_index,
+    compute_summary,
+)
+from src.api.utils.exporters import export_report_csv, export_report_json
+
+
+def _cases(sessions: List[str], report: Report) -> Dict[str, Callable[[], Any]]:
+    target = sessions[0]
+    baseline = sessions[1] if len(sessions) > 1 else sessions[0]
+    return {
+        "compute_summary.single_session.auto": lambda: compute_summary([target], heatmap_scaling="auto"),
+        "compute_summary.all_sessions.auto": lambda: compute_summary(sessions, heatmap_scaling="auto"),
+        "compute_summary.all_sessions.fixed": lambda: compute_summary(sessions, heatmap_scaling="fixed"),
+        "compute_summary.all_sessions.session": lambda: compute_summary(sessions, heatmap_scaling="session"),
+        "compute_baseline_comparison": lambda: compute_baseline_comparison(target, baseline),
+        "compute_diversity_index": lambda: compute_diversity_index(target),
+        "export_report_json": lambda: export_report_json(report),
+        "export_report_csv": lambda: export_report_csv(report),
+    }
+
+
+# PUBLIC_INTERFACE
+def run_micro_benchmarks(config: WorkloadConfig, repeat: int = 5, warmup: int = 1) -> Dict[str, Any]:
+    """Run every micro-benchmark against a fully loaded synthetic store and return the result document."""
+    results: Dict[str, Any] = {}
+    with synthetic_store(config) as store:
+        for name, fn in _cases(session_ids(config), REPORTS[BENCH_REPORT_ID]).items():
+            results[name] = time_call(fn, repeat=repeat, warmup=warmup)
+
+    return build_result(
+        "micro",
+        {**config.model_dump(mode="json"), "repeat": repeat, "warmup": warmup, "store": store},
+        results,
+    )
+
+
+# PUBLIC_INTERFACE
+def run_streaming_micro_benchmarks(
+    config: WorkloadConfig,
+    chunk_events: int,
+    repeat: int = 3,
+    warmup: int = 0,
+) -> Dict[str, Any]:
+    """Run the micro-benchmarks chunk by chunk so the store never holds more than one chunk.
+
+    "all_sessions" cases cover the sessions of the current chunk; statistics aggregate the
+    samples of every chunk.
+    """
+    samples: Dict[str, List[float]] = {}
+    chunks = 0
+    events = 0
+    largest_chunk = 0
+    # Animals, behaviors and the report without events; each chunk's events are swapped in below.
+    with synthetic_store(config.model_copy(update={"events_per_session": 0})):
+        base_report = REPORTS[BENCH_REPORT_ID]
+        for chunk in iter_session_chunks(config, chunk_events):
+            EVENTS[:] = chunk
+            sessions = list(dict.fromkeys(e.session_id for e in chunk))
+            report = base_report.model_copy(update={"sessions": sessions})
+            for name, fn in _cases(sessions, report).items():
+                samples.setdefault(name, []).extend(time_samples(fn, repeat=repeat, warmup=warmup))
+            chunks += 1
+            events += len(chunk)
+            largest_chunk = max(largest_chunk, len(chunk))
+            EVENTS.clear()
+            del chunk
+
+    store = {"chunks": chunks, "events": events, "largest_chunk_events": largest_chunk}
+    return build_result(
+        "micro-streaming",
+        {
+            **config.model_dump(mode="json"),
+            "chunk_events": chunk_events,
+            "repeat": repeat,
+            "warmup": warmup,
+            "store": store,
+        },
+        {name: summarize_timings(values) for name, values in samples.items()},
+    )
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for analytics and exporters.")
+    add_workload_arguments(parser)
+    parser.add_argument("--repeat", type=int, default=5, help="Measured runs per benchmark (per chunk when streaming).")
+    parser.add_argument("--warmup", type=int, default=1, help="Unmeasured warmup runs per benchmark.")
+    parser.add_argument(
+        "--chunk-events",
+        type=int,
+        default=None,
+        help="Stream the workload through the store in chunks of about this many events "
+        "instead of loading it all at once (needed beyond a few million events).",
+    )
+    parser.add_argument("--output", default=None, help="Write JSON results to this path instead of stdout.")
+    args = parser.parse_args(argv)
+    config = config_from_args(args)
+    if args.chunk_events:
+        result = run_streaming_micro_benchmarks(config, args.chunk_events, repeat=args.repeat, warmup=args.warmup)
+    else:
+        result = run_micro_benchmarks(config, repeat=args.repeat, warmup=args.warmup)
+    emit(result, args.output)
+
+
+if __name__ == "__main__":
+    main()
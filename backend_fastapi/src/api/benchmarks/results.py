@@ -0,0 +1,70 @@
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+
+# PUBLIC_INTERFACE
+def summarize_timings(samples_s: List[float]) -> Dict[str, float]:
+    """Summarize wall-clock samples (seconds) into millisecond statistics."""
+    if not samples_s:
+        return {"runs": 0}
+    ordered = sorted(samples_s)
+    p95_idx = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+    return {
+        "runs": len(ordered),
+        "min_ms": round(ordered[0] * 1000.0, 4),
+        "mean_ms": round(statistics.fmean(ordered) * 1000.0, 4),
+        "median_ms": round(statistics.median(ordered) * 1000.0, 4),
+        "p95_ms": round(ordered[p95_idx] * 1000.0, 4),
+        "max_ms": round(ordered[-1] * 1000.0, 4),
+    }
+
+
+# PUBLIC_INTERFACE
+def time_samples(fn: Callable[[], Any], repeat: int = 5, warmup: int = 1) -> List[float]:
+    """Call fn warmup + repeat times and return the wall-clock seconds of the measured runs."""
+    for _ in range(warmup):
+        fn()
+    samples: List[float] = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+# PUBLIC_INTERFACE
+def time_call(fn: Callable[[], Any], repeat: int = 5, warmup: int = 1) -> Dict[str, float]:
+    """Call fn warmup + repeat times and return timing statistics for the measured runs."""
+    return summarize_timings(time_samples(fn, repeat=repeat, warmup=warmup))
+
+
+# PUBLIC_INTERFACE
+def build_result(suite: str, config: Dict[str, Any], results: Dict[str, Any]) -> Dict[str, Any]:
+    """Wrap benchmark results with the metadata needed to compare runs over time."""
+    return {
+        "suite": suite,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+        },
+        "config": config,
+        "results": results,
+    }
+
+
+# PUBLIC_INTERFACE
+def emit(result: Dict[str, Any], output: Optional[str] = None) -> None:
+    """Write a result document as JSON to the given path, or to stdout when no path is given."""
+    text = json.dumps(result, indent=2, default=str)
+    if output:
+        with open(output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
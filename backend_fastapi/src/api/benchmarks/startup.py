@@ -0,0 +1,110 @@
+"""Cold-start benchmark: import time, startup hook and time-to-first-request.
+
+Each run starts a fresh interpreter so module caches do not hide import cost. Run from
+``backend_fastapi``::
+
+    python -m src.api.benchmarks.startup --runs 10 --output startup.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from src.api.benchmarks.results import build_result, emit, summarize_timings
+
+# Executed in a child interpreter; prints phase timestamps relative to its own start.
+_PROBE = r"""
+import asyncio, json, sys, time
+import httpx
+
+path = sys.argv[1]
+t0 = time.perf_counter()
+from src.api.main import app
+t_import = time.perf_counter()
+
+
+async def main():
+    async with app.router.lifespan_context(app):
+        t_startup = time.perf_counter()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            status = (await client.get(path)).status_code
+            t_first = time.perf_counter()
+            await client.get("/openapi.json")
+            t_openapi = time.perf_counter()
+    return {
+        "import_s": t_import - t0,
+        "startup_s": t_startup - t_import,
+        "first_request_s": t_first - t_startup,
+        "time_to_first_request_s": t_first - t0,
+        "openapi_s": t_openapi - t_first,
+        "status": status,
+    }
+
+
+print(json.dumps(asyncio.run(main())))
+"""
+
+_PHASES = ["import_s", "startup_s", "first_request_s", "time_to_first_request_s", "openapi_s", "process_s"]
+
+
+def _run_once(path: str, env: Dict[str, str], cwd: str) -> Dict[str, Any]:
+    t0 = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE, path],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    sample = json.loads(proc.stdout.strip().splitlines()[-1])
+    sample["process_s"] = time.perf_counter() - t0
+    return sample
+
+
+# PUBLIC_INTERFACE
+def run_startup_benchmark(
+    runs: int = 5,
+    path: str = "/",
+    seed: bool = True,
+    openapi_cache: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Measure cold-start phases over several fresh interpreters and return the result document."""
+    cwd = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    env = dict(os.environ)
+    env["SEED_DATA"] = "true" if seed else "false"
+    if openapi_cache:
+        env["OPENAPI_CACHE_PATH"] = os.path.abspath(openapi_cache)
+    else:
+        env.pop("OPENAPI_CACHE_PATH", None)
+
+    samples: List[Dict[str, Any]] = [_run_once(path, env, cwd) for _ in range(runs)]
+    results: Dict[str, Any] = {phase: summarize_timings([s[phase] for s in samples]) for phase in _PHASES}
+    results["status_codes"] = sorted({s["status"] for s in samples})
+    config = {"runs": runs, "path": path, "seed": seed, "openapi_cache": openapi_cache}
+    return build_result("startup", config, results)
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="Cold-start and time-to-first-request benchmark.")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to start.")
+    parser.add_argument("--path", default="/", help="Path requested as the first request.")
+    parser.add_argument("--no-seed", action="store_true", help="Start with SEED_DATA=false.")
+    parser.add_argument("--openapi-cache", default=None, help="Pre-generated schema to use as OPENAPI_CACHE_PATH.")
+    parser.add_argument("--output", default=None, help="Write JSON results to this path instead of stdout.")
+    args = parser.parse_args(argv)
+    emit(
+        run_startup_benchmark(
+            runs=args.runs, path=args.path, seed=not args.no_seed, openapi_cache=args.openapi_cache
+        ),
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+import argparse
+import itertools
+import random
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List
+
+from pydantic import BaseModel, Field
+
+from src.api.models import (
+    ANIMALS,
+    BEHAVIORS,
+    EVENTS,
+    REPORTS,
+    Animal,
+    Behavior,
+    BehaviorEvent,
+    Report,
+)
+
+# Default behavior mix roughly matching the seed data: mostly resting, occasional alerts.
+DEFAULT_BEHAVIOR_MIX: Dict[str, float] = {
+    "b-rest": 0.4,
+    "b-feed": 0.2,
+    "b-play": 0.15,
+    "b-groom": 0.15,
+    "b-alert": 0.1,
+}
+
+BENCH_REPORT_ID = "r-bench"
+
+# Measured resident cost of one generated BehaviorEvent held in EVENTS (~1.25 KB). Loading a whole
+# workload into the store is therefore practical up to a few million events per few GB of RAM;
+# larger workloads should be streamed in chunks (see iter_session_chunks).
+APPROX_BYTES_PER_EVENT = 1250
+
+_SPECIES = ["Canis familiaris", "Felis catus", "Ursus arctos", "Panthera leo", "Equus caballus"]
+_PALETTE = ["#6B7280", "#10B981", "#3B82F6", "#F59E0B", "#EF4444", "#8B5CF6", "#EC4899", "#14B8A6"]
+
+
+# PUBLIC_INTERFACE
+class WorkloadConfig(BaseModel):
+    """Shape of a synthetic workload: how many animals, sessions, cameras and events to generate."""
+
+    animals: int = Field(10, ge=1, description="Number of animals.")
+    sessions: int = Field(20, ge=1, description="Number of sessions; each session follows one animal.")
+    cameras_per_session: int = Field(2, ge=1, description="Cameras recording each session.")
+    events_per_session: int = Field(500, ge=0, description="Events generated per session across all cameras.")
+    session_minutes: int = Field(60, ge=1, description="Length of each session window in minutes.")
+    min_duration_s: int = Field(5, ge=1, description="Shortest generated event duration (seconds).")
+    max_duration_s: int = Field(120, ge=1, description="Longest generated event duration (seconds).")
+    behavior_mix: Dict[str, float] = Field(
+        default_factory=lambda: dict(DEFAULT_BEHAVIOR_MIX),
+        description="Behavior id -> relative weight. Unknown behavior ids are created on the fly.",
+    )
+    start: datetime = Field(datetime(2024, 1, 1), description="Start timestamp of the first session.")
+    seed: int = Field(42, description="Random seed; identical configs generate identical workloads.")
+
+    @property
+    def total_events(self) -> int:
+        """Total number of events this workload generates."""
+        return self.sessions * self.events_per_session
+
+
+# PUBLIC_INTERFACE
+def session_ids(config: WorkloadConfig) -> List[str]:
+    """Return the synthetic session ids in generation order."""
+    return [f"syn-s-{i}" for i in range(config.sessions)]
+
+
+# PUBLIC_INTERFACE
+def generate_animals(config: WorkloadConfig) -> List[Animal]:
+    """Return the synthetic animals for a workload."""
+    rng = random.Random(config.seed)
+    return [
+        Animal(
+            id=f"syn-a-{i}",
+            name=f"Animal {i}",
+            species=_SPECIES[i % len(_SPECIES)],
+            age_years=round(rng.uniform(0.5, 15.0), 1),
+            tags=["synthetic"],
+        )
+        for i in range(config.animals)
+    ]
+
+
+# PUBLIC_INTERFACE
+def generate_behaviors(config: WorkloadConfig) -> List[Behavior]:
+    """Return behavior definitions for every id in the mix, reusing existing definitions when present."""
+    behaviors: List[Behavior] = []
+    for i, behavior_id in enumerate(config.behavior_mix):
+        existing = BEHAVIORS.get(behavior_id)
+        if existing is not None:
+            behaviors.append(existing)
+            continue
+        behaviors.append(
+            Behavior(
+                id=behavior_id,
+                label=behavior_id.removeprefix("b-").replace("-", " ").title(),
+                category="Synthetic",
+                color=_PALETTE[i % len(_PALETTE)],
+            )
+        )
+    return behaviors
+
+
+# PUBLIC_INTERFACE
+def iter_events(config: WorkloadConfig) -> Iterator[BehaviorEvent]:
+    """Lazily yield synthetic events session by session.
+
+    Events are built with ``model_construct`` (no validation) so that tens of millions of
+    events can be streamed without the generator dominating the measurement.
+    """
+    rng = random.Random(config.seed)
+    behavior_ids = list(config.behavior_mix)
+    cum_weights: List[float] = []
+    acc = 0.0
+    for b in behavior_ids:
+        acc += max(config.behavior_mix[b], 0.0)
+        cum_weights.append(acc)
+    if not behavior_ids or acc <= 0:
+        raise ValueError("behavior_mix must contain at least one positive weight")
+
+    window_s = config.session_minutes * 60
+    metadata = {"annotator": "synthetic", "marker": "bench"}
+    eid = 0
+    for s_idx, session_id in enumerate(session_ids(config)):
+        animal_id = f"syn-a-{s_idx % config.animals}"
+        session_start = config.start + timedelta(minutes=s_idx * config.session_minutes)
+        cameras = [f"cam-{c}" for c in range(config.cameras_per_session)]
+        picks = rng.choices(behavior_ids, cum_weights=cum_weights, k=config.events_per_session)
+        for i, behavior_id in enumerate(picks):
+            start = session_start + timedelta(seconds=rng.randrange(window_s))
+            duration = rng.randint(config.min_duration_s, max(config.min_duration_s, config.max_duration_s))
+            yield BehaviorEvent.model_construct(
+                id=f"syn-e-{eid}",
+                animal_id=animal_id,
+                behavior_id=behavior_id,
+                session_id=session_id,
+                camera_id=cameras[i % len(cameras)],
+                start_ts=start,
+                end_ts=start + timedelta(seconds=duration),
+                confidence=round(rng.uniform(0.5, 1.0), 3),
+                metadata=metadata,
+            )
+            eid += 1
+
+
+# PUBLIC_INTERFACE
+def iter_session_chunks(config: WorkloadConfig, chunk_events: int) -> Iterator[List[BehaviorEvent]]:
+    """Yield events in chunks of whole sessions holding at least chunk_events events each.
+
+    Only one chunk is alive at a time, so memory stays bounded by the chunk size
+    (about ``chunk_events * APPROX_BYTES_PER_EVENT``) regardless of the workload size.
+    """
+    chunk: List[BehaviorEvent] = []
+    for _, session_events in itertools.groupby(iter_events(config), key=lambda e: e.session_id):
+        chunk.extend(session_events)
+        if len(chunk) >= chunk_events:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# PUBLIC_INTERFACE
+def populate_store(config: WorkloadConfig, replace: bool = True) -> Dict[str, int]:
+    """Load a synthetic workload into the in-memory repositories.
+
+    The repositories are mutated in place because routers hold direct references to them.
+    A ``r-bench`` report covering every synthetic session is added for exporter benchmarks.
+    The whole workload is materialized (about APPROX_BYTES_PER_EVENT per event, so roughly
+    12 GB for 10M events); use iter_session_chunks for larger workloads.
+    """
+    behaviors = generate_behaviors(config)
+    if replace:
+        ANIMALS.clear()
+        BEHAVIORS.clear()
+        EVENTS.clear()
+        REPORTS.clear()
+
+    ANIMALS.update({a.id: a for a in generate_animals(config)})
+    BEHAVIORS.update({b.id: b for b in behaviors})
+    EVENTS.extend(iter_events(config))
+    REPORTS[BENCH_REPORT_ID] = Report(
+        id=BENCH_REPORT_ID,
+        name="Synthetic benchmark report",
+        sessions=session_ids(config),
+        created_at=config.start,
+        notes="Generated by the benchmark suite.",
+    )
+    return {
+        "animals": len(ANIMALS),
+        "behaviors": len(BEHAVIORS),
+        "events": len(EVENTS),
+        "reports": len(REPORTS),
+    }
+
+
+# PUBLIC_INTERFACE
+@contextmanager
+def synthetic_store(config: WorkloadConfig) -> Iterator[Dict[str, int]]:
+    """Swap the in-memory repositories for a synthetic workload and restore them on exit."""
+    saved = (dict(ANIMALS), dict(BEHAVIORS), list(EVENTS), dict(REPORTS))
+    try:
+        yield populate_store(config, replace=True)
+    finally:
+        ANIMALS.clear()
+        BEHAVIORS.clear()
+        EVENTS.clear()
+        REPORTS.clear()
+        ANIMALS.update(saved[0])
+        BEHAVIORS.update(saved[1])
+        EVENTS.extend(saved[2])
+        REPORTS.update(saved[3])
+
+
+def _parse_mix(text: str) -> Dict[str, float]:
+    """Parse ``b-rest=0.5,b-feed=0.5`` into a behavior mix."""
+    mix: Dict[str, float] = {}
+    for part in text.split(","):
+        if not part.strip():
+            continue
+        key, _, value = part.partition("=")
+        try:
+            mix[key.strip()] = float(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid behavior weight: {part!r}") from None
+    if not mix:
+        raise argparse.ArgumentTypeError("behavior mix must not be empty")
+    return mix
+
+
+# PUBLIC_INTERFACE
+def add_workload_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the command line flags shared by every benchmark entry point."""
+    defaults = WorkloadConfig()
+    group = parser.add_argument_group("workload")
+    group.add_argument("--animals", type=int, default=defaults.animals)
+    group.add_argument("--sessions", type=int, default=defaults.sessions)
+    group.add_argument("--cameras", type=int, default=defaults.cameras_per_session)
+    group.add_argument(
+        "--events-per-session",
+        type=int,
+        default=defaults.events_per_session,
+        help="Events per session. Loading the full workload costs ~%d bytes per event in RAM; "
+        "stream larger workloads with the micro benchmark's --chunk-events."
+        % APPROX_BYTES_PER_EVENT,
+    )
+    group.add_argument("--session-minutes", type=int, default=defaults.session_minutes)
+    group.add_argument(
+        "--behavior-mix",
+        type=_parse_mix,
+        default=None,
+        help="Comma separated behavior=weight pairs, e.g. b-rest=0.7,b-alert=0.3",
+    )
+    group.add_argument("--seed", type=int, default=defaults.seed)
+
+
+# PUBLIC_INTERFACE
+def config_from_args(args: argparse.Namespace) -> WorkloadConfig:
+    """Build a WorkloadConfig from flags registered by add_workload_arguments."""
+    values = {
+        "animals": args.animals,
+        "sessions": args.sessions,
+        "cameras_per_session": args.cameras,
+        "events_per_session": args.events_per_session,
+        "session_minutes": args.session_minutes,
+        "seed": args.seed,
+    }
+    if args.behavior_mix:
+        values["behavior_mix"] = args.behavior_mix
+    return WorkloadConfig(**values)
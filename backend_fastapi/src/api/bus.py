@@ -0,0 +1,324 @@
+import asyncio
+import fcntl
+import json
+import logging
+import os
+import threading
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional
+
+from src.api.utils.metrics import BUS_BATCH_SIZE, BUS_FRAMES_DROPPED, BUS_MESSAGES
+
+logger = logging.getLogger(__name__)
+
+Message = Dict[str, object]
+Deliver = Callable[[List[Message]], Awaitable[None]]
+
+# Upper bound for a single newline-delimited batch frame on the IPC socket.
+_FRAME_LIMIT = 64 * 1024 * 1024
+
+# Frames the hub buffers per peer before dropping frames for that (slow) peer.
+_PEER_QUEUE_FRAMES = 1000
+
+
+# PUBLIC_INTERFACE
+class BroadcastBus:
+    """In-process broadcast bus: buffers published messages and delivers them once per tick.
+
+    ``publish`` is thread-safe and non-blocking so it can be called from sync route handlers
+    running in the threadpool. Messages published within one tick are handed to the deliver
+    callback as a single batch. Messages published while the bus is not running are dropped
+    (and counted) rather than buffered without bound. Subclasses extend ``_dispatch`` to forward
+    batches elsewhere.
+    """
+
+    name = "inprocess"
+
+    def __init__(self, tick_s: float = 0.01, max_batch: int = 1000):
+        self.tick_s = tick_s
+        self.max_batch = max_batch
+        self._buffer: Deque[Message] = deque()
+        self._deliver: Optional[Deliver] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._flush_task is not None and not self._flush_task.done()
+
+    async def start(self, deliver: Deliver) -> None:
+        """Start flushing to deliver on the running event loop."""
+        if self.running:
+            return
+        self._deliver = deliver
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._wakeup = asyncio.Event()
+        self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop flushing after delivering anything still buffered."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        # Stop accepting messages, then deliver what was already published.
+        self._loop = None
+        self._loop_thread = None
+        while self._buffer:
+            await self._flush_once()
+
+    def publish(self, message: Message) -> None:
+        """Queue a JSON-serializable message for every subscriber; safe to call from any thread."""
+        loop = self._loop
+        if loop is None or self._wakeup is None:
+            BUS_MESSAGES.labels(self.name, "dropped").inc()
+            return
+        self._buffer.append(message)
+        BUS_MESSAGES.labels(self.name, "published").inc()
+        if threading.get_ident() == self._loop_thread:
+            self._wakeup.set()
+        else:
+            loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            # Let the rest of this tick's messages accumulate into one batch.
+            await asyncio.sleep(self.tick_s)
+            while self._buffer:
+                await self._flush_once()
+
+    async def _flush_once(self) -> None:
+        batch: List[Message] = []
+        while self._buffer and len(batch) < self.max_batch:
+            batch.append(self._buffer.popleft())
+        if not batch:
+            return
+        BUS_BATCH_SIZE.labels(self.name).observe(len(batch))
+        try:
+            await self._dispatch(batch)
+        except Exception:
+            logger.exception("Broadcast bus %s failed to dispatch a batch", self.name)
+
+    async def _dispatch(self, batch: List[Message]) -> None:
+        await self._deliver(batch)
+
+
+# PUBLIC_INTERFACE
+class UnixSocketBus(BroadcastBus):
+    """Broadcast bus shared by every worker on a host through a Unix domain socket.
+
+    One worker becomes the hub: it holds an exclusive ``flock`` on ``<path>.lock`` and listens on
+    ``path``. Every worker (the hub included) connects to the hub as a peer, delivers its own
+    batches locally and sends them to the hub, which relays each batch to all other peers.
+    If the hub worker exits its lock is released, and the remaining workers elect a new hub on
+    reconnect. Delivery is best effort: batches published while no hub is reachable are only
+    delivered locally. An unusable path is logged and retried every ``retry_s``.
+    """
+
+    name = "unix"
+
+    def __init__(self, path: str, tick_s: float = 0.01, max_batch: int = 1000, retry_s: float = 0.5):
+        super().__init__(tick_s=tick_s, max_batch=max_batch)
+        self.path = path
+        self.retry_s = retry_s
+        self._lock_fd: Optional[int] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._peers: Dict[asyncio.StreamWriter, asyncio.Queue] = {}
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._connected = asyncio.Event()
+        self._conn_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_hub(self) -> bool:
+        return self._server is not None
+
+    async def start(self, deliver: Deliver) -> None:
+        await super().start(deliver)
+        self._connected = asyncio.Event()
+        self._conn_task = asyncio.create_task(self._maintain_connection())
+
+    async def wait_connected(self, timeout: float = 5.0) -> bool:
+        """Wait until this worker is connected to a hub; return False on timeout."""
+        try:
+            await asyncio.wait_for(self._connected.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def stop(self) -> None:
+        await super().stop()
+        if self._conn_task is not None:
+            self._conn_task.cancel()
+            try:
+                await self._conn_task
+            except asyncio.CancelledError:
+                pass
+            except Exception:
+                logger.exception("Broadcast bus %s connection task failed", self.name)
+            self._conn_task = None
+        self._close_writer()
+        await self._close_hub()
+
+    async def _dispatch(self, batch: List[Message]) -> None:
+        await self._deliver(batch)
+        writer = self._writer
+        if writer is None:
+            return
+        try:
+            writer.write(json.dumps(batch).encode() + b"\n")
+            await writer.drain()
+        except (ConnectionError, OSError):
+            self._close_writer()
+
+    async def _maintain_connection(self) -> None:
+        # Log the first failure of a streak with its traceback, not every retry.
+        failing = False
+        while True:
+            try:
+                await self._try_become_hub()
+            except OSError:
+                if not failing:
+                    logger.exception("Broadcast bus %s cannot serve as hub on %s; retrying", self.name, self.path)
+                failing = True
+                await asyncio.sleep(self.retry_s)
+                continue
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.path, limit=_FRAME_LIMIT)
+            except (FileNotFoundError, ConnectionRefusedError):
+                # The worker holding the hub lock has not started listening yet.
+                await asyncio.sleep(self.retry_s)
+                continue
+            except OSError:
+                if not failing:
+                    logger.exception("Broadcast bus %s cannot connect to %s; retrying", self.name, self.path)
+                failing = True
+                await asyncio.sleep(self.retry_s)
+                continue
+            if failing:
+                logger.info("Broadcast bus %s connected to %s", self.name, self.path)
+                failing = False
+            self._writer = writer
+            self._connected.set()
+            try:
+                while True:
+                    line = await reader.readline()
+                    if not line:
+                        break
+                    batch = json.loads(line)
+                    BUS_MESSAGES.labels(self.name, "received").inc(len(batch))
+                    await self._deliver(batch)
+            except (ConnectionError, OSError, ValueError):
+                pass
+            finally:
+                self._connected.clear()
+                self._close_writer()
+            await asyncio.sleep(self.retry_s)
+
+    async def _try_become_hub(self) -> None:
+        if self._server is not None:
+            return
+        if self._lock_fd is None:
+            fd = os.open(self.path + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                os.close(fd)
+                return
+            self._lock_fd = fd
+        try:
+            # Holding the lock means any existing socket file is stale.
+            self._unlink_socket()
+            self._server = await asyncio.start_unix_server(self._handle_peer, path=self.path, limit=_FRAME_LIMIT)
+        except OSError:
+            # Release the lock so a worker that can bind the socket becomes hub instead.
+            self._release_lock()
+            raise
+
+    async def _handle_peer(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        # Each peer gets its own bounded queue and writer task so a slow peer never delays
+        # reading from the sender or relaying to the other peers.
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_PEER_QUEUE_FRAMES)
+        self._peers[writer] = queue
+        relay = asyncio.create_task(self._peer_writer(writer, queue))
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                for peer, peer_queue in list(self._peers.items()):
+                    if peer is writer:
+                        continue
+                    try:
+                        peer_queue.put_nowait(line)
+                    except asyncio.QueueFull:
+                        BUS_FRAMES_DROPPED.labels(self.name).inc()
+        except (ConnectionError, OSError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            self._peers.pop(writer, None)
+            relay.cancel()
+            writer.close()
+
+    async def _peer_writer(self, writer: asyncio.StreamWriter, queue: asyncio.Queue) -> None:
+        try:
+            while True:
+                line = await queue.get()
+                writer.write(line)
+                await writer.drain()
+        except (ConnectionError, OSError):
+            self._peers.pop(writer, None)
+            writer.close()
+
+    def _close_writer(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    async def _close_hub(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for peer in list(self._peers):
+                peer.close()
+            self._peers.clear()
+            await self._server.wait_closed()
+            self._server = None
+            self._unlink_socket()
+        self._release_lock()
+
+    def _unlink_socket(self) -> None:
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _release_lock(self) -> None:
+        if self._lock_fd is not None:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+
+# PUBLIC_INTERFACE
+def create_bus() -> BroadcastBus:
+    """Build the broadcast bus selected by environment variables.
+
+    BROADCAST_BUS: ``inprocess`` (default, single worker) or ``unix`` (all workers on a host).
+    BROADCAST_BUS_PATH: Unix socket path for the ``unix`` bus.
+    BROADCAST_BUS_TICK_MS: batching interval in milliseconds (default 10).
+    """
+    kind = os.getenv("BROADCAST_BUS", "inprocess").lower()
+    tick_s = float(os.getenv("BROADCAST_BUS_TICK_MS", "10")) / 1000.0
+    if kind == "inprocess":
+        return BroadcastBus(tick_s=tick_s)
+    if kind == "unix":
+        path = os.getenv("BROADCAST_BUS_PATH", "/tmp/vizai-broadcast.sock")
+        return UnixSocketBus(path, tick_s=tick_s)
+    raise ValueError(f"Unknown BROADCAST_BUS: {kind!r} (expected 'inprocess' or 'unix')")
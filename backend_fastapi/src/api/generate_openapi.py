@@ -1,13 +1,21 @@
 import json
 import os
 
-# Import application first to ensure all routers are registered before schema generation
+# Import application first to ensure all routers are registered before schema generation.
+# Seed data is only loaded by the app's startup hook, so it is not pulled in here.
 from src.api.main import app  # noqa
+from src.api.utils.openapi import FINGERPRINT_KEY, build_openapi_schema, schema_fingerprint
 
 
 def generate_and_write_openapi():
-    """Generate the OpenAPI schema from the fully-initialized FastAPI app and write to interfaces/openapi.json."""
-    openapi_schema = app.openapi()
+    """Generate the OpenAPI schema from the fully-initialized FastAPI app and write to interfaces/openapi.json.
+
+    The schema is always rebuilt from the routes (never read from OPENAPI_CACHE_PATH). It is written
+    with a fingerprint of the routes and their source so the file can in turn be served as that
+    cache, and is ignored once the code it was generated from changes.
+    """
+    openapi_schema = build_openapi_schema(app)
+    openapi_schema[FINGERPRINT_KEY] = schema_fingerprint(app)
 
     output_dir = "interfaces"
     os.makedirs(output_dir, exist_ok=True)
@@ -1,15 +1,21 @@
 import os
+from contextlib import asynccontextmanager
 from typing import List, Optional
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.api.models import seed_data
 from src.api.routes.animals import router as animals_router
 from src.api.routes.behaviors import router as behaviors_router
 from src.api.routes.reports import router as reports_router
 from src.api.routes.analytics import router as analytics_router
 from src.api.routes.ingest import router as ingest_router
+from src.api.routes.metrics import router as metrics_router
 from src.api.sockets import router as sockets_router
+from src.api.sockets import start_broadcast_bus, stop_broadcast_bus
+from src.api.utils.metrics import MetricsMiddleware
+from src.api.utils.openapi import install_openapi_cache
 
 # Configure app with OpenAPI metadata and tags
 openapi_tags = [
@@ -20,13 +26,28 @@ openapi_tags = [
     {"name": "Analytics", "description": "Analytics summaries and comparisons."},
     {"name": "Ingest", "description": "Data ingestion for behavior events."},
     {"name": "Sockets", "description": "WebSocket endpoints for real-time updates."},
+    {"name": "Metrics", "description": "Prometheus metrics and runtime profiling."},
 ]
 
+# Seed preview data on startup unless disabled (SEED_DATA=false), keeping imports side-effect free
+seed_on_startup: bool = os.getenv("SEED_DATA", "true").lower() not in ("0", "false", "no")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if seed_on_startup:
+        seed_data()
+    await start_broadcast_bus()
+    yield
+    await stop_broadcast_bus()
+
+
 app = FastAPI(
     title="VizAI Animal Behavior Analytics API",
     description="Preview backend providing in-memory data, analytics, and real-time updates for UI development.",
     version="0.1.0-preview",
     openapi_tags=openapi_tags,
+    lifespan=lifespan,
 )
 
 # CORS configuration
@@ -41,6 +62,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request counts and latency per route for /metrics
+app.add_middleware(MetricsMiddleware)
+
 
 # PUBLIC_INTERFACE
 @app.get("/", tags=["Health"], summary="Health Check")
@@ -56,3 +80,7 @@ app.include_router(reports_router, prefix="")
 app.include_router(analytics_router, prefix="")
 app.include_router(ingest_router, prefix="")
 app.include_router(sockets_router, prefix="")
+app.include_router(metrics_router, prefix="")
+
+# Serve a pre-generated schema (see generate_openapi) when OPENAPI_CACHE_PATH points at one
+install_openapi_cache(app, os.getenv("OPENAPI_CACHE_PATH"))
@@ -5,6 +5,8 @@ from typing import Dict, List, Optional, Set, Tuple
 
 from pydantic import BaseModel, Field
 
+from src.api.utils.metrics import ANALYTICS_DURATION, EVENT_STORE_SIZE, timed
+
 
 # PUBLIC_INTERFACE
 class Animal(BaseModel):
@@ -96,13 +98,15 @@ class DiversityIndexResult(BaseModel):
     support: Dict[str, float] = Field(..., description="Behavior -> proportion used for computation.")
 
 
-# In-memory repositories with seed data enabling multi-camera synchronized playback
+# In-memory repositories; seed data enabling multi-camera synchronized playback is loaded by seed_data()
 
 ANIMALS: Dict[str, Animal] = {}
 BEHAVIORS: Dict[str, Behavior] = {}
 EVENTS: List[BehaviorEvent] = []
 REPORTS: Dict[str, Report] = {}
 
+EVENT_STORE_SIZE.set_function(lambda: len(EVENTS))
+
 
 def _seed_data():
     # Animals
@@ -176,7 +180,23 @@ def _seed_data():
     )
 
 
-_seed_data()
+_seeded = False
+
+
+# PUBLIC_INTERFACE
+def seed_data() -> bool:
+    """Load the preview seed data into the in-memory repositories once.
+
+    Called from the application startup hook rather than at import time so that importing
+    models (e.g. for schema generation or benchmarks) stays side-effect free.
+    Returns False if the data was already seeded.
+    """
+    global _seeded
+    if _seeded:
+        return False
+    _seed_data()
+    _seeded = True
+    return True
 
 
 # Utility analytics
@@ -190,6 +210,7 @@ def _bin_key_minute(ts: datetime) -> str:
 
 
 # PUBLIC_INTERFACE
+@timed(ANALYTICS_DURATION, "compute_summary")
 def compute_summary(
     session_ids: List[str],
     heatmap_scaling: str = "auto",  # fixed | auto | session
@@ -257,6 +278,7 @@ def compute_summary(
 
 
 # PUBLIC_INTERFACE
+@timed(ANALYTICS_DURATION, "compute_baseline_comparison")
 def compute_baseline_comparison(session_id: str, baseline_id: str) -> BaselineComparison:
     """Compute percent deltas for counts and durations between a session and its baseline."""
     def agg(session: str) -> Tuple[Dict[str, int], Dict[str, float]]:
@@ -294,6 +316,7 @@ def compute_baseline_comparison(session_id: str, baseline_id: str) -> BaselineCo
 
 
 # PUBLIC_INTERFACE
+@timed(ANALYTICS_DURATION, "compute_diversity_index")
 def compute_diversity_index(session_id: str) -> DiversityIndexResult:
     """Compute Shannon-like entropy H = -sum(p_i * ln p_i), normalized by ln(N)."""
     import math
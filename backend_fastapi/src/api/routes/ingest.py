@@ -6,6 +6,7 @@ from pydantic import BaseModel, Field
 
 from src.api.models import EVENTS, BehaviorEvent, compute_summary
 from src.api.sockets import broadcast_event, broadcast_analytics_delta
+from src.api.utils.metrics import INGEST_DUPLICATE_CHECK_DURATION, INGEST_EVENTS, INGEST_REJECTED
 
 router = APIRouter(prefix="/ingest", tags=["Ingest"])
 
@@ -28,10 +29,14 @@ class IngestEvent(BaseModel):
 @router.post("/event", summary="Ingest a behavior event")
 def ingest_event(payload: IngestEvent):
     """Append an event to the in-memory repository and broadcast to WebSocket clients."""
-    if any(e.id == payload.id for e in EVENTS):
+    with INGEST_DUPLICATE_CHECK_DURATION.time():
+        duplicate = any(e.id == payload.id for e in EVENTS)
+    if duplicate:
+        INGEST_REJECTED.labels("duplicate").inc()
         raise HTTPException(status_code=409, detail="Event id already exists")
     event = BehaviorEvent(**payload.model_dump())
     EVENTS.append(event)
+    INGEST_EVENTS.inc()
 
     # Broadcast new event
     broadcast_event(event)
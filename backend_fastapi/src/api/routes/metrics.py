@@ -0,0 +1,74 @@
+import os
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from src.api.utils.metrics import CONTENT_TYPE, render_latest
+from src.api.utils.profiler import PROFILER
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+# The sampling profiler is opt-in per deployment: its routes 404 unless PROFILER_ENABLED is set
+profiler_enabled: bool = os.getenv("PROFILER_ENABLED", "false").lower() in ("1", "true", "yes")
+
+
+def _require_profiler_enabled():
+    if not profiler_enabled:
+        raise HTTPException(status_code=404, detail="Profiler is disabled")
+
+
+# PUBLIC_INTERFACE
+@router.get(
+    "",
+    summary="Prometheus metrics",
+    response_class=PlainTextResponse,
+    description="Timing histograms, ingest and websocket counters, store size and cache lookups "
+    "in the Prometheus text exposition format. Values are per worker process: with several workers "
+    "each scrape reaches one of them, identified by worker_info{pid} and process_start_time_seconds.",
+)
+def metrics():
+    """Return all registered metrics in text exposition format."""
+    return PlainTextResponse(render_latest(), media_type=CONTENT_TYPE)
+
+
+# PUBLIC_INTERFACE
+@router.get("/profiler", summary="Profiler status", dependencies=[Depends(_require_profiler_enabled)])
+def profiler_status():
+    """Return whether the sampling profiler is running and how much it has collected."""
+    return PROFILER.status()
+
+
+# PUBLIC_INTERFACE
+@router.post(
+    "/profiler/start", summary="Start sampling profiler", dependencies=[Depends(_require_profiler_enabled)]
+)
+def profiler_start(
+    intervalMs: float = Query(default=5.0, ge=1.0, le=1000.0, alias="intervalMs"),
+    reset: bool = Query(default=True),
+):
+    """Start the sampling profiler at runtime; it adds no overhead until started."""
+    started = PROFILER.start(interval_s=intervalMs / 1000.0, reset=reset)
+    return {"started": started, **PROFILER.status()}
+
+
+# PUBLIC_INTERFACE
+@router.post(
+    "/profiler/stop", summary="Stop sampling profiler", dependencies=[Depends(_require_profiler_enabled)]
+)
+def profiler_stop():
+    """Stop the sampling profiler, keeping collected samples for download."""
+    stopped = PROFILER.stop()
+    return {"stopped": stopped, **PROFILER.status()}
+
+
+# PUBLIC_INTERFACE
+@router.get(
+    "/profiler/stacks",
+    summary="Profiler samples",
+    response_class=PlainTextResponse,
+    description="Collected samples in collapsed-stack format, suitable for flamegraph tools.",
+    dependencies=[Depends(_require_profiler_enabled)],
+)
+def profiler_stacks():
+    """Return collapsed stacks collected by the sampling profiler."""
+    return PlainTextResponse(PROFILER.collapsed())
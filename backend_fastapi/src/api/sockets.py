@@ -1,27 +1,100 @@
 import asyncio
-from typing import Set
+import time
+from typing import Dict, List, Optional
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from src.api.bus import BroadcastBus, create_bus
 from src.api.models import AnalyticsSummary, BehaviorEvent
+from src.api.utils.metrics import (
+    BUS_MESSAGES,
+    WS_BROADCAST_DURATION,
+    WS_CLIENTS,
+    WS_DROPPED,
+    WS_MESSAGES,
+    WS_SEND_DURATION,
+    WS_SEND_ERRORS,
+)
 
 router = APIRouter(tags=["Sockets"])
 
-_clients: Set[WebSocket] = set()
+# Connected clients and their outgoing queues; a single writer task per client drains its queue
+# so messages are sent in order even when sends are slow.
+_clients: Dict[WebSocket, asyncio.Queue] = {}
+
+# Batches buffered per client before further batches are dropped for that client.
+_CLIENT_QUEUE_BATCHES = 1000
+
+WS_CLIENTS.set_function(lambda: len(_clients))
+
+# Broadcasts go through the bus so that clients connected to other workers receive them too.
+# Built on startup (see start_broadcast_bus) so a bad bus configuration cannot break imports.
+_bus: Optional[BroadcastBus] = None
 
 
 def _prune(ws: WebSocket):
-    try:
-        _clients.remove(ws)
-    except KeyError:
-        pass
+    _clients.pop(ws, None)
 
 
-async def _send_safe(ws: WebSocket, message):
+async def _send_safe(ws: WebSocket, message) -> bool:
+    kind = message.get("type", "")
+    t0 = time.perf_counter()
     try:
         await ws.send_json(message)
     except Exception:
+        WS_SEND_ERRORS.inc()
         _prune(ws)
+        return False
+    WS_SEND_DURATION.labels(kind).observe(time.perf_counter() - t0)
+    WS_MESSAGES.labels(kind).inc()
+    return True
+
+
+async def _client_writer(ws: WebSocket, queue: asyncio.Queue):
+    while True:
+        batch = await queue.get()
+        for message in batch:
+            if not await _send_safe(ws, message):
+                return
+
+
+def _enqueue(queue: asyncio.Queue, batch: List[Dict]):
+    try:
+        queue.put_nowait(batch)
+    except asyncio.QueueFull:
+        WS_DROPPED.inc()
+
+
+async def _deliver_local(batch: List[Dict]):
+    t0 = time.perf_counter()
+    for queue in list(_clients.values()):
+        _enqueue(queue, batch)
+    WS_BROADCAST_DURATION.observe(time.perf_counter() - t0)
+
+
+def _publish(message: Dict):
+    if _bus is None:
+        BUS_MESSAGES.labels("none", "dropped").inc()
+        return
+    _bus.publish(message)
+
+
+# PUBLIC_INTERFACE
+async def start_broadcast_bus():
+    """Build the configured bus and start delivering its messages to this worker's clients (app startup)."""
+    global _bus
+    if _bus is None:
+        _bus = create_bus()
+    await _bus.start(_deliver_local)
+
+
+# PUBLIC_INTERFACE
+async def stop_broadcast_bus():
+    """Flush pending broadcasts and disconnect from the bus (app shutdown)."""
+    global _bus
+    if _bus is not None:
+        await _bus.stop()
+        _bus = None
 
 
 # PUBLIC_INTERFACE
@@ -37,7 +110,9 @@ async def ws_events(websocket: WebSocket):
     - Periodic pings keep the connection alive.
     """
     await websocket.accept()
-    _clients.add(websocket)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_CLIENT_QUEUE_BATCHES)
+    _clients[websocket] = queue
+    writer = asyncio.create_task(_client_writer(websocket, queue))
 
     try:
         while True:
@@ -45,27 +120,27 @@ async def ws_events(websocket: WebSocket):
                 # Receive ping/pong or client messages to keep connection active
                 _ = await asyncio.wait_for(websocket.receive_text(), timeout=30.0)
             except asyncio.TimeoutError:
-                # Send heartbeat
-                await websocket.send_json({"type": "heartbeat"})
+                # Send heartbeat through the writer so it never interleaves with broadcasts
+                _enqueue(queue, [{"type": "heartbeat"}])
             await asyncio.sleep(0.1)
     except WebSocketDisconnect:
-        _prune(websocket)
+        pass
     except Exception:
+        pass
+    finally:
         _prune(websocket)
+        writer.cancel()
 
 
 # PUBLIC_INTERFACE
 def broadcast_event(event: BehaviorEvent):
-    """Broadcast a new BehaviorEvent to all connected websocket clients."""
-    payload = {"type": "event", "data": event.model_dump()}
-    # Fire-and-forget
-    for ws in list(_clients):
-        asyncio.create_task(_send_safe(ws, payload))
+    """Broadcast a new BehaviorEvent to websocket clients on every worker."""
+    payload = {"type": "event", "data": event.model_dump(mode="json")}
+    _publish(payload)
 
 
 # PUBLIC_INTERFACE
 def broadcast_analytics_delta(summary: AnalyticsSummary):
-    """Broadcast a lightweight analytics delta to connected clients."""
-    payload = {"type": "analytics_delta", "data": summary.model_dump()}
-    for ws in list(_clients):
-        asyncio.create_task(_send_safe(ws, payload))
+    """Broadcast a lightweight analytics delta to connected clients on every worker."""
+    payload = {"type": "analytics_delta", "data": summary.model_dump(mode="json")}
+    _publish(payload)
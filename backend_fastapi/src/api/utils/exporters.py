@@ -3,9 +3,11 @@ import io
 from typing import Dict
 
 from src.api.models import Report, compute_summary
+from src.api.utils.metrics import EXPORT_DURATION, timed
 
 
 # PUBLIC_INTERFACE
+@timed(EXPORT_DURATION, "json")
 def export_report_json(report: Report) -> Dict:
     """Return a JSON export for the report containing sessions and analytics summaries."""
     summary = compute_summary(report.sessions, heatmap_scaling="auto")
@@ -16,6 +18,7 @@ def export_report_json(report: Report) -> Dict:
 
 
 # PUBLIC_INTERFACE
+@timed(EXPORT_DURATION, "csv")
 def export_report_csv(report: Report) -> str:
     """Return a CSV text containing flattened analytics data suitable for spreadsheets."""
     summary = compute_summary(report.sessions, heatmap_scaling="auto")
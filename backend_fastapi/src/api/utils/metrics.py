@@ -0,0 +1,356 @@
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Text exposition format served by /metrics (Prometheus 0.0.4).
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latency buckets in seconds; extends the Prometheus defaults down to 100µs for in-memory work.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+class _CounterValue:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeValue:
+    __slots__ = ("value", "_fn")
+
+    def __init__(self):
+        self.value = 0.0
+        self._fn: Optional[Callable[[], float]] = None
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+    def set_function(self, fn: Callable[[], float]) -> None:
+        """Evaluate fn at scrape time instead of tracking a stored value."""
+        self._fn = fn
+
+    def get(self) -> float:
+        return float(self._fn()) if self._fn is not None else self.value
+
+
+class _HistogramValue:
+    __slots__ = ("buckets", "counts", "sum", "count", "_lock")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        idx = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[idx] += 1
+            self.sum += value
+            self.count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - t0)
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), registry=None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        (registry if registry is not None else REGISTRY).register(self)
+        if not self.labelnames:
+            # Unlabelled metrics are exported as zero before the first update.
+            self.labels()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: str):
+        """Return the time series for the given label values, creating it on first use."""
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _label_text(self, key: Tuple[str, ...], extra: str = "") -> str:
+        pairs = [f'{n}="{_escape(v)}"' for n, v in zip(self.labelnames, key)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            children = sorted(self._children.items(), key=lambda kv: kv[0])
+        for key, child in children:
+            lines.extend(self._render_child(key, child))
+        return lines
+
+    def _render_child(self, key, child) -> List[str]:
+        raise NotImplementedError
+
+
+# PUBLIC_INTERFACE
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterValue()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def _render_child(self, key, child) -> List[str]:
+        return [f"{self.name}{self._label_text(key)} {_fmt(child.value)}"]
+
+
+# PUBLIC_INTERFACE
+class Gauge(_Metric):
+    """Value that can go up and down, optionally computed on scrape."""
+
+    kind = "gauge"
+
+    def _new_child(self):
+        return _GaugeValue()
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def set_function(self, fn: Callable[[], float]) -> None:
+        self.labels().set_function(fn)
+
+    def _render_child(self, key, child) -> List[str]:
+        return [f"{self.name}{self._label_text(key)} {_fmt(child.get())}"]
+
+
+# PUBLIC_INTERFACE
+class Histogram(_Metric):
+    """Cumulative histogram of observed values (typically durations in seconds)."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        registry=None,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def time(self):
+        return self.labels().time()
+
+    def _render_child(self, key, child) -> List[str]:
+        lines: List[str] = []
+        cumulative = 0
+        for bound, n in zip(self.buckets, child.counts):
+            cumulative += n
+            le = 'le="%s"' % _fmt(bound)
+            lines.append(f"{self.name}_bucket{self._label_text(key, le)} {cumulative}")
+        inf = 'le="+Inf"'
+        lines.append(f"{self.name}_bucket{self._label_text(key, inf)} {child.count}")
+        lines.append(f"{self.name}_sum{self._label_text(key)} {_fmt(child.sum)}")
+        lines.append(f"{self.name}_count{self._label_text(key)} {child.count}")
+        return lines
+
+
+# PUBLIC_INTERFACE
+class Registry:
+    """Collection of metrics rendered together in the text exposition format."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> None:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt(value: float) -> str:
+    return repr(float(value))
+
+
+REGISTRY = Registry()
+
+
+# PUBLIC_INTERFACE
+def timed(histogram: Histogram, *label_values: str):
+    """Decorator recording the wall-clock duration of each call into histogram."""
+    child = histogram.labels(*label_values)
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                child.observe(time.perf_counter() - t0)
+
+        return wrapper
+
+    return decorator
+
+
+# PUBLIC_INTERFACE
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """Count a cache lookup; hit ratio is cache_lookups_total{result="hit"} / sum over results."""
+    CACHE_LOOKUPS.labels(cache, "hit" if hit else "miss").inc()
+
+
+# PUBLIC_INTERFACE
+def render_latest() -> str:
+    """Render every registered metric in the text exposition format."""
+    return REGISTRY.render()
+
+
+# PUBLIC_INTERFACE
+class MetricsMiddleware:
+    """ASGI middleware recording request counts and latency per method and route template.
+
+    Routes are labelled by their path template (``/animals/{animal_id}``) rather than the raw
+    path so label cardinality stays bounded; unmatched paths share a single label.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._endpoint_paths: Dict[object, str] = {}
+
+    def _route_label(self, scope) -> str:
+        path = getattr(scope.get("route"), "path", None)
+        if path:
+            return path
+        # Plain Starlette routes (/openapi.json, /docs, /redoc) only set scope["endpoint"].
+        endpoint = scope.get("endpoint")
+        router = scope.get("router")
+        if endpoint is None or router is None:
+            return "<unmatched>"
+        path = self._endpoint_paths.get(endpoint)
+        if path is None:
+            for candidate in router.routes:
+                if getattr(candidate, "endpoint", None) is endpoint:
+                    path = self._endpoint_paths[endpoint] = candidate.path
+                    break
+        return path or "<unmatched>"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        t0 = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - t0
+            path = self._route_label(scope)
+            method = scope.get("method", "")
+            HTTP_REQUEST_DURATION.labels(method, path).observe(elapsed)
+            HTTP_REQUESTS.labels(method, path, str(status["code"])).inc()
+
+
+# Application metrics
+
+# Every worker process keeps its own registry; these identify which worker served a scrape.
+PROCESS_START_TIME = Gauge("process_start_time_seconds", "Start time of the process since the Unix epoch in seconds.")
+PROCESS_START_TIME.set(time.time())
+WORKER_INFO = Gauge("worker_info", "Constant 1, labelled with the pid of the worker process serving this scrape.", ["pid"])
+WORKER_INFO.labels(str(os.getpid())).set(1)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests by method, route template and status code.", ["method", "route", "status"]
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by method and route template.", ["method", "route"]
+)
+ANALYTICS_DURATION = Histogram(
+    "analytics_function_duration_seconds", "Execution time of analytics functions.", ["function"]
+)
+EXPORT_DURATION = Histogram("report_export_duration_seconds", "Report export generation time.", ["format"])
+INGEST_EVENTS = Counter("ingest_events_total", "Events accepted by the ingest endpoint.")
+INGEST_REJECTED = Counter("ingest_rejected_total", "Events rejected by the ingest endpoint.", ["reason"])
+INGEST_DUPLICATE_CHECK_DURATION = Histogram(
+    "ingest_duplicate_check_duration_seconds", "Time spent checking ingested event ids for duplicates."
+)
+EVENT_STORE_SIZE = Gauge("event_store_events", "Events held in the in-memory event store.")
+WS_CLIENTS = Gauge("websocket_clients", "Connected websocket clients.")
+WS_MESSAGES = Counter("websocket_messages_sent_total", "Websocket messages delivered by type.", ["type"])
+WS_DROPPED = Counter(
+    "websocket_messages_dropped_total", "Broadcast batches dropped for clients whose send queue is full."
+)
+WS_SEND_ERRORS = Counter("websocket_send_errors_total", "Websocket sends that failed and pruned the client.")
+WS_SEND_DURATION = Histogram("websocket_send_duration_seconds", "Latency of a single websocket send.", ["type"])
+WS_BROADCAST_DURATION = Histogram(
+    "websocket_broadcast_duration_seconds", "Time to fan a batch of broadcasts out to every local client."
+)
+BUS_MESSAGES = Counter(
+    "broadcast_bus_messages_total",
+    "Bus messages by direction: published, received from other workers, or dropped while the bus was stopped.",
+    ["bus", "direction"],
+)
+BUS_FRAMES_DROPPED = Counter(
+    "broadcast_bus_frames_dropped_total", "Batch frames the hub dropped for peers that fell behind.", ["bus"]
+)
+BUS_BATCH_SIZE = Histogram(
+    "broadcast_bus_batch_size", "Messages flushed per bus tick.", ["bus"],
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+CACHE_LOOKUPS = Counter("cache_lookups_total", "Cache lookups by cache name and result.", ["cache", "result"])
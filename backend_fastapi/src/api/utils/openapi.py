@@ -0,0 +1,119 @@
+import hashlib
+import inspect
+import json
+import os
+import sys
+import typing
+from typing import Any, Dict, Optional, Set
+
+import fastapi
+from fastapi import FastAPI
+from fastapi.openapi.utils import get_openapi
+
+from src.api.utils.metrics import record_cache_lookup
+
+# Top-level key carrying schema_fingerprint() in files written by generate_openapi; stripped when served.
+FINGERPRINT_KEY = "x-schema-fingerprint"
+
+
+# PUBLIC_INTERFACE
+def build_openapi_schema(app: FastAPI) -> Dict[str, Any]:
+    """Generate the OpenAPI schema exactly as FastAPI.openapi does, bypassing any cache."""
+    return get_openapi(
+        title=app.title,
+        version=app.version,
+        openapi_version=app.openapi_version,
+        summary=app.summary,
+        description=app.description,
+        terms_of_service=app.terms_of_service,
+        contact=app.contact,
+        license_info=app.license_info,
+        routes=app.routes,
+        webhooks=app.webhooks.routes,
+        tags=app.openapi_tags,
+        servers=app.servers,
+        separate_input_output_schemas=app.separate_input_output_schemas,
+    )
+
+
+def _model_modules(annotation: Any, found: Set[str]) -> None:
+    """Collect the modules defining the classes referenced by a (possibly generic) annotation."""
+    if annotation is None:
+        return
+    module = getattr(annotation, "__module__", None)
+    if inspect.isclass(annotation) and module:
+        found.add(module)
+    for arg in typing.get_args(annotation):
+        _model_modules(arg, found)
+
+
+# PUBLIC_INTERFACE
+def schema_fingerprint(app: FastAPI) -> str:
+    """Return a hash of everything the OpenAPI schema is generated from.
+
+    Covers app metadata, the FastAPI version, each route's methods, path, endpoint qualname and
+    response model, plus the source of every module defining an endpoint or response model, so
+    parameter, model or docstring edits invalidate a cached schema even when the version is unchanged.
+    """
+    digest = hashlib.sha256()
+    meta = [app.title, app.version, app.description, app.openapi_tags, fastapi.__version__]
+    digest.update(json.dumps(meta, sort_keys=True, default=str).encode())
+    modules: Set[str] = set()
+    for route in app.routes:
+        if not getattr(route, "include_in_schema", False):
+            continue
+        endpoint = getattr(route, "endpoint", None)
+        response_model = getattr(route, "response_model", None)
+        entry = [
+            sorted(getattr(route, "methods", None) or []),
+            getattr(route, "path", ""),
+            f"{getattr(endpoint, '__module__', '')}.{getattr(endpoint, '__qualname__', '')}",
+            repr(response_model),
+        ]
+        digest.update(json.dumps(entry).encode())
+        if endpoint is not None:
+            modules.add(endpoint.__module__)
+        _model_modules(response_model, modules)
+    for name in sorted(modules):
+        module = sys.modules.get(name)
+        source = getattr(module, "__file__", None)
+        if not source or "site-packages" in source:
+            continue
+        digest.update(name.encode())
+        with open(source, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _load_cached(app: FastAPI, path: str) -> Optional[Dict[str, Any]]:
+    """Return the schema stored at path if its fingerprint matches this app, else None."""
+    try:
+        with open(path) as f:
+            schema = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if schema.pop(FINGERPRINT_KEY, None) != schema_fingerprint(app):
+        return None
+    return schema
+
+
+# PUBLIC_INTERFACE
+def install_openapi_cache(app: FastAPI, cache_path: Optional[str] = None) -> None:
+    """Replace app.openapi with a version that can start from a pre-generated schema file.
+
+    When cache_path points at a schema written by generate_openapi whose fingerprint matches
+    schema_fingerprint(app), it is loaded instead of regenerating the schema on the first
+    /openapi.json request. Otherwise the schema is built once and kept in memory as FastAPI
+    normally does.
+    """
+
+    def openapi() -> Dict[str, Any]:
+        if app.openapi_schema:
+            record_cache_lookup("openapi", hit=True)
+            return app.openapi_schema
+        schema = _load_cached(app, cache_path) if cache_path and os.path.exists(cache_path) else None
+        record_cache_lookup("openapi", hit=schema is not None)
+        app.openapi_schema = schema if schema is not None else build_openapi_schema(app)
+        return app.openapi_schema
+
+    app.openapi = openapi
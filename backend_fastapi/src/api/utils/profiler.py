@@ -0,0 +1,103 @@
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+# PUBLIC_INTERFACE
+class SamplingProfiler:
+    """Wall-clock sampling profiler for every thread in the process.
+
+    A background thread periodically snapshots all thread stacks via ``sys._current_frames``
+    and counts identical stacks. Output uses the collapsed-stack format understood by
+    flamegraph tools (``frame;frame;frame count``). Nothing runs while the profiler is stopped.
+    """
+
+    def __init__(self, max_depth: int = 64):
+        self.max_depth = max_depth
+        self.interval_s = 0.005
+        self._counts: Dict[str, int] = {}
+        self._samples = 0
+        self._started_at: Optional[float] = None
+        self._elapsed_s = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, interval_s: float = 0.005, reset: bool = True) -> bool:
+        """Start sampling every interval_s seconds; return False if already running."""
+        with self._lock:
+            if self.running:
+                return False
+            if reset:
+                self._counts = {}
+                self._samples = 0
+                self._elapsed_s = 0.0
+            self.interval_s = interval_s
+            self._stop.clear()
+            self._started_at = time.perf_counter()
+            self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+            self._thread.start()
+            return True
+
+    def stop(self) -> bool:
+        """Stop sampling, keeping collected samples; return False if it was not running."""
+        with self._lock:
+            if not self.running:
+                return False
+            self._stop.set()
+            thread = self._thread
+        thread.join()
+        with self._lock:
+            self._thread = None
+            if self._started_at is not None:
+                self._elapsed_s += time.perf_counter() - self._started_at
+                self._started_at = None
+        return True
+
+    def status(self) -> Dict[str, object]:
+        elapsed = self._elapsed_s
+        if self._started_at is not None:
+            elapsed += time.perf_counter() - self._started_at
+        return {
+            "running": self.running,
+            "interval_ms": round(self.interval_s * 1000.0, 3),
+            "samples": self._samples,
+            "distinct_stacks": len(self._counts),
+            "elapsed_s": round(elapsed, 3),
+        }
+
+    def collapsed(self) -> str:
+        """Return collected stacks in collapsed format, most frequent first."""
+        with self._lock:
+            items = sorted(self._counts.items(), key=lambda kv: kv[1], reverse=True)
+        return "".join(f"{stack} {count}\n" for stack, count in items)
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval_s):
+            frames = sys._current_frames()
+            stacks: List[str] = []
+            for ident, frame in frames.items():
+                if ident == own:
+                    continue
+                parts: List[str] = []
+                depth = 0
+                while frame is not None and depth < self.max_depth:
+                    code = frame.f_code
+                    parts.append(f"{code.co_filename}:{code.co_name}:{frame.f_lineno}")
+                    frame = frame.f_back
+                    depth += 1
+                stacks.append(";".join(reversed(parts)))
+            del frames
+            with self._lock:
+                for stack in stacks:
+                    self._counts[stack] = self._counts.get(stack, 0) + 1
+                self._samples += 1
+
+
+PROFILER = SamplingProfiler()
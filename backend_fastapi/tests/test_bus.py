@@ -0,0 +1,240 @@
+import asyncio
+import fcntl
+import logging
+import os
+import threading
+
+from fastapi.testclient import TestClient
+
+from src.api import sockets
+from src.api.bus import BroadcastBus, UnixSocketBus
+from src.api.main import app
+from src.api.models import EVENTS
+from src.api.utils.metrics import BUS_MESSAGES
+
+EVENT_PAYLOAD = {
+    "animal_id": "a-1",
+    "behavior_id": "b-rest",
+    "session_id": "s-100",
+    "camera_id": "cam-A",
+    "start_ts": "2024-01-01T12:00:00",
+    "end_ts": "2024-01-01T12:00:10",
+    "confidence": 0.5,
+}
+
+
+def _collector():
+    batches = []
+
+    async def deliver(batch):
+        batches.append(list(batch))
+
+    return batches, deliver
+
+
+async def _wait_until(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            return False
+        await asyncio.sleep(0.01)
+    return True
+
+
+def test_messages_published_within_a_tick_are_delivered_as_one_batch():
+    async def scenario():
+        batches, deliver = _collector()
+        bus = BroadcastBus(tick_s=0.05)
+        await bus.start(deliver)
+        for n in range(5):
+            bus.publish({"n": n})
+        assert await _wait_until(lambda: batches)
+        await asyncio.sleep(0.1)
+        await bus.stop()
+        return batches
+
+    assert asyncio.run(scenario()) == [[{"n": n} for n in range(5)]]
+
+
+def test_publish_from_a_worker_thread_is_delivered_on_the_loop():
+    async def scenario():
+        batches, deliver = _collector()
+        bus = BroadcastBus(tick_s=0.01)
+        await bus.start(deliver)
+        thread = threading.Thread(target=lambda: [bus.publish({"n": n}) for n in range(3)])
+        thread.start()
+        thread.join()
+        assert await _wait_until(lambda: sum(len(b) for b in batches) == 3)
+        await bus.stop()
+        return [m for b in batches for m in b]
+
+    assert asyncio.run(scenario()) == [{"n": 0}, {"n": 1}, {"n": 2}]
+
+
+def test_messages_published_before_start_are_dropped():
+    async def scenario():
+        batches, deliver = _collector()
+        bus = BroadcastBus(tick_s=0.01)
+        bus.publish({"n": 1})
+        await bus.start(deliver)
+        bus.publish({"n": 2})
+        assert await _wait_until(lambda: batches)
+        await bus.stop()
+        return batches
+
+    assert asyncio.run(scenario()) == [[{"n": 2}]]
+
+
+def test_local_delivery_keeps_order_for_slow_clients():
+    class SlowWebSocket:
+        def __init__(self):
+            self.sent = []
+
+        async def send_json(self, message):
+            # Earlier messages are slower, so concurrent senders would reorder them
+            await asyncio.sleep(0.02 if message["n"] % 2 == 0 else 0.0)
+            self.sent.append(message["n"])
+
+    async def scenario():
+        ws = SlowWebSocket()
+        queue = asyncio.Queue()
+        sockets._clients[ws] = queue
+        writer = asyncio.create_task(sockets._client_writer(ws, queue))
+        try:
+            await sockets._deliver_local([{"type": "event", "n": 0}, {"type": "event", "n": 1}])
+            await sockets._deliver_local([{"type": "event", "n": 2}, {"type": "event", "n": 3}])
+            assert await _wait_until(lambda: len(ws.sent) == 4)
+        finally:
+            writer.cancel()
+            sockets._prune(ws)
+        return ws.sent
+
+    assert asyncio.run(scenario()) == [0, 1, 2, 3]
+
+
+def test_unix_socket_bus_relays_between_instances(tmp_path):
+    path = str(tmp_path / "bus.sock")
+
+    async def scenario():
+        got_a, deliver_a = _collector()
+        got_b, deliver_b = _collector()
+        a = UnixSocketBus(path, tick_s=0.01, retry_s=0.05)
+        b = UnixSocketBus(path, tick_s=0.01, retry_s=0.05)
+        await a.start(deliver_a)
+        assert await a.wait_connected()
+        await b.start(deliver_b)
+        assert await b.wait_connected()
+        assert a.is_hub and not b.is_hub
+
+        a.publish({"from": "a"})
+        b.publish({"from": "b"})
+        assert await _wait_until(lambda: len(got_a) == 2 and len(got_b) == 2)
+        await asyncio.sleep(0.1)
+        await a.stop()
+        await b.stop()
+        return got_a, got_b
+
+    got_a, got_b = asyncio.run(scenario())
+    # Each instance sees its own message once (locally) and the other's once (via the hub)
+    assert sorted(m["from"] for batch in got_a for m in batch) == ["a", "b"]
+    assert sorted(m["from"] for batch in got_b for m in batch) == ["a", "b"]
+
+
+def test_unix_socket_bus_elects_new_hub_after_hub_stops(tmp_path):
+    path = str(tmp_path / "bus.sock")
+
+    async def scenario():
+        _, deliver_a = _collector()
+        got_b, deliver_b = _collector()
+        got_c, deliver_c = _collector()
+        a = UnixSocketBus(path, tick_s=0.01, retry_s=0.05)
+        b = UnixSocketBus(path, tick_s=0.01, retry_s=0.05)
+        await a.start(deliver_a)
+        assert await a.wait_connected()
+        await b.start(deliver_b)
+        assert await b.wait_connected()
+
+        await a.stop()
+        assert await _wait_until(lambda: b.is_hub)
+        assert await b.wait_connected()
+
+        c = UnixSocketBus(path, tick_s=0.01, retry_s=0.05)
+        await c.start(deliver_c)
+        assert await c.wait_connected()
+        assert not c.is_hub
+
+        c.publish({"n": 1})
+        assert await _wait_until(lambda: got_b and got_c)
+        await b.stop()
+        await c.stop()
+        return got_b, got_c
+
+    got_b, got_c = asyncio.run(scenario())
+    assert got_b == [[{"n": 1}]]
+    assert got_c == [[{"n": 1}]]
+
+
+def test_unix_socket_bus_logs_unusable_path_and_stops_cleanly(tmp_path, caplog):
+    path = str(tmp_path / "missing" / "bus.sock")
+
+    async def scenario():
+        _, deliver = _collector()
+        bus = UnixSocketBus(path, tick_s=0.01, retry_s=0.01)
+        await bus.start(deliver)
+        assert not await bus.wait_connected(timeout=0.2)
+        assert not bus._conn_task.done()  # still retrying
+        bus.publish({"n": 1})
+        await bus.stop()
+
+    with caplog.at_level(logging.ERROR, logger="src.api.bus"):
+        asyncio.run(scenario())
+    errors = [r for r in caplog.records if r.name == "src.api.bus" and r.levelno == logging.ERROR]
+    # Logged once with the cause, not on every retry
+    assert len(errors) == 1
+    assert isinstance(errors[0].exc_info[1], FileNotFoundError)
+
+
+def test_unix_socket_bus_releases_hub_lock_when_bind_fails(tmp_path, caplog):
+    # Longer than sun_path allows, so binding fails after the lock file was created and locked
+    path = str(tmp_path / ("x" * 120 + ".sock"))
+
+    async def scenario():
+        _, deliver = _collector()
+        bus = UnixSocketBus(path, tick_s=0.01, retry_s=10.0)
+        await bus.start(deliver)
+        assert await _wait_until(lambda: caplog.records)
+        fd = os.open(path + ".lock", os.O_RDWR)
+        try:
+            # Raises BlockingIOError if the failed worker still held the hub lock
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        finally:
+            os.close(fd)
+        await bus.stop()
+
+    with caplog.at_level(logging.ERROR, logger="src.api.bus"):
+        asyncio.run(scenario())
+
+
+def test_ingest_from_threadpool_reaches_websocket_clients():
+    with TestClient(app) as client:
+        with client.websocket_connect("/ws/events") as ws:
+            resp = client.post("/ingest/event", json={"id": "test-bus-e-1", **EVENT_PAYLOAD})
+            assert resp.status_code == 200
+            first = ws.receive_json()
+            second = ws.receive_json()
+    EVENTS[:] = [e for e in EVENTS if e.id != "test-bus-e-1"]
+    assert first["type"] == "event"
+    assert first["data"]["id"] == "test-bus-e-1"
+    assert second["type"] == "analytics_delta"
+
+
+def test_ingest_without_lifespan_does_not_buffer_broadcasts():
+    dropped = BUS_MESSAGES.labels("none", "dropped")
+    before = dropped.value
+    client = TestClient(app)  # no context manager: lifespan (and the bus) never starts
+    resp = client.post("/ingest/event", json={"id": "test-bus-e-2", **EVENT_PAYLOAD})
+    EVENTS[:] = [e for e in EVENTS if e.id != "test-bus-e-2"]
+    assert resp.status_code == 200
+    assert sockets._bus is None
+    # The event and its analytics delta are dropped and counted instead of piling up
+    assert dropped.value - before == 2
@@ -0,0 +1,129 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+from src.api.models import EVENTS, REPORTS
+from src.api.routes import metrics as metrics_routes
+from src.api.utils.metrics import (
+    CONTENT_TYPE,
+    EXPORT_DURATION,
+    HTTP_REQUESTS,
+    INGEST_EVENTS,
+    INGEST_REJECTED,
+    Counter,
+    Histogram,
+    Registry,
+)
+
+EVENT_PAYLOAD = {
+    "id": "test-metrics-e-1",
+    "animal_id": "a-1",
+    "behavior_id": "b-rest",
+    "session_id": "s-100",
+    "camera_id": "cam-A",
+    "start_ts": "2024-01-01T12:00:00",
+    "end_ts": "2024-01-01T12:00:10",
+    "confidence": 0.5,
+}
+
+PROFILER_ROUTES = [
+    ("get", "/metrics/profiler"),
+    ("post", "/metrics/profiler/start"),
+    ("post", "/metrics/profiler/stop"),
+    ("get", "/metrics/profiler/stacks"),
+]
+
+
+def test_histogram_buckets_are_cumulative_and_match_observations():
+    registry = Registry()
+    hist = Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0, 10.0), registry=registry)
+    for value in (0.05, 0.1, 0.5, 5.0, 50.0):
+        hist.observe(value)
+
+    lines = registry.render().splitlines()
+    assert lines == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{le="0.1"} 2',
+        'latency_seconds_bucket{le="1.0"} 3',
+        'latency_seconds_bucket{le="10.0"} 4',
+        'latency_seconds_bucket{le="+Inf"} 5',
+        "latency_seconds_sum 55.65",
+        "latency_seconds_count 5",
+    ]
+
+
+def test_label_values_are_escaped():
+    registry = Registry()
+    counter = Counter("things_total", "Things.", ["name"], registry=registry)
+    counter.labels('a "quoted"\\path\nnext').inc()
+
+    assert 'things_total{name="a \\"quoted\\"\\\\path\\nnext"} 1.0' in registry.render().splitlines()
+
+
+def test_wrong_label_count_raises():
+    counter = Counter("pairs_total", "Pairs.", ["left", "right"], registry=Registry())
+    with pytest.raises(ValueError):
+        counter.labels("only-one")
+    with pytest.raises(ValueError):
+        counter.inc()
+
+
+def test_metrics_endpoint_serves_exposition_format():
+    client = TestClient(app)
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == CONTENT_TYPE
+    assert "# TYPE http_requests_total counter" in resp.text
+    assert "process_start_time_seconds " in resp.text
+    assert "worker_info{pid=" in resp.text
+
+
+def test_ingest_and_export_move_their_series():
+    accepted = INGEST_EVENTS.labels()
+    duplicates = INGEST_REJECTED.labels("duplicate")
+    csv_exports = EXPORT_DURATION.labels("csv")
+    json_exports = EXPORT_DURATION.labels("json")
+    before = (accepted.value, duplicates.value, csv_exports.count, json_exports.count)
+
+    with TestClient(app) as client:
+        try:
+            assert client.post("/ingest/event", json=EVENT_PAYLOAD).status_code == 200
+            assert client.post("/ingest/event", json=EVENT_PAYLOAD).status_code == 409
+        finally:
+            EVENTS[:] = [e for e in EVENTS if e.id != EVENT_PAYLOAD["id"]]
+        report_id = next(iter(REPORTS))
+        assert client.get(f"/export/reports/{report_id}.csv").status_code == 200
+        assert client.get(f"/export/reports/{report_id}.json").status_code == 200
+
+    after = (accepted.value, duplicates.value, csv_exports.count, json_exports.count)
+    assert [a - b for a, b in zip(after, before)] == [1, 1, 1, 1]
+
+
+def test_docs_routes_are_labelled_by_path():
+    unmatched = HTTP_REQUESTS.labels("GET", "<unmatched>", "200")
+    openapi = HTTP_REQUESTS.labels("GET", "/openapi.json", "200")
+    missing = HTTP_REQUESTS.labels("GET", "<unmatched>", "404")
+    before = (unmatched.value, openapi.value, missing.value)
+
+    client = TestClient(app)
+    assert client.get("/openapi.json").status_code == 200
+    assert client.get("/no-such-route").status_code == 404
+
+    assert (unmatched.value, openapi.value, missing.value) == (before[0], before[1] + 1, before[2] + 1)
+
+
+def test_profiler_routes_are_hidden_unless_enabled(monkeypatch):
+    client = TestClient(app)
+    monkeypatch.setattr(metrics_routes, "profiler_enabled", False)
+    for method, path in PROFILER_ROUTES:
+        assert getattr(client, method)(path).status_code == 404
+
+    monkeypatch.setattr(metrics_routes, "profiler_enabled", True)
+    try:
+        assert client.get("/metrics/profiler").json()["running"] is False
+        assert client.post("/metrics/profiler/start").status_code == 200
+        assert client.post("/metrics/profiler/stop").status_code == 200
+        assert client.get("/metrics/profiler/stacks").status_code == 200
+    finally:
+        metrics_routes.PROFILER.stop()
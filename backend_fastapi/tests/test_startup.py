@@ -0,0 +1,91 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api import main, models
+from src.api.generate_openapi import generate_and_write_openapi
+from src.api.main import app
+from src.api.utils.metrics import CACHE_LOOKUPS
+from src.api.utils.openapi import FINGERPRINT_KEY, build_openapi_schema, install_openapi_cache
+
+STORES = (models.ANIMALS, models.BEHAVIORS, models.EVENTS, models.REPORTS)
+
+
+@pytest.fixture
+def cached_schema(tmp_path, monkeypatch):
+    """Write interfaces/openapi.json under tmp_path and serve app.openapi from it."""
+    monkeypatch.chdir(tmp_path)
+    generate_and_write_openapi()
+    path = tmp_path / "interfaces" / "openapi.json"
+    # monkeypatch restores the app's own cached schema and openapi() afterwards
+    monkeypatch.setattr(app, "openapi_schema", None)
+    monkeypatch.setattr(app, "openapi", app.openapi)
+    install_openapi_cache(app, str(path))
+    return path
+
+
+@pytest.fixture
+def empty_store(monkeypatch):
+    """Run with unseeded, empty stores and put the previous contents back afterwards."""
+    saved = [store.copy() for store in STORES]
+    monkeypatch.setattr(models, "_seeded", False)
+    for store in STORES:
+        store.clear()
+    yield
+    for store, contents in zip(STORES, saved):
+        store.clear()
+        if isinstance(store, dict):
+            store.update(contents)
+        else:
+            store.extend(contents)
+
+
+def _lookups():
+    return CACHE_LOOKUPS.labels("openapi", "hit").value, CACHE_LOOKUPS.labels("openapi", "miss").value
+
+
+def test_generated_schema_file_is_served_without_fingerprint(cached_schema):
+    assert FINGERPRINT_KEY in json.loads(cached_schema.read_text())
+    hits, misses = _lookups()
+
+    resp = TestClient(app).get("/openapi.json")
+
+    assert resp.status_code == 200
+    assert FINGERPRINT_KEY not in resp.json()
+    assert resp.json() == build_openapi_schema(app)
+    assert _lookups() == (hits + 1, misses)
+
+
+def test_mismatched_fingerprint_falls_back_to_built_schema(cached_schema):
+    schema = json.loads(cached_schema.read_text())
+    schema[FINGERPRINT_KEY] = "stale"
+    schema["info"]["title"] = "Tampered"
+    cached_schema.write_text(json.dumps(schema))
+    hits, misses = _lookups()
+
+    client = TestClient(app)
+    first = client.get("/openapi.json").json()
+    second = client.get("/openapi.json").json()
+
+    assert first == second == build_openapi_schema(app)
+    assert first["info"]["title"] == app.title
+    # The miss builds the schema once; later requests hit the in-memory copy
+    assert _lookups() == (hits + 1, misses + 1)
+
+
+def test_seed_data_seeds_only_once(empty_store):
+    assert models.seed_data() is True
+    counts = [len(store) for store in STORES]
+    assert all(counts)
+
+    assert models.seed_data() is False
+    assert [len(store) for store in STORES] == counts
+
+
+def test_lifespan_skips_seeding_when_disabled(empty_store, monkeypatch):
+    monkeypatch.setattr(main, "seed_on_startup", False)
+    with TestClient(app) as client:
+        assert client.get("/animals").json() == []
+    assert not any(STORES)
+    assert models._seeded is False